@@ -1,6 +1,13 @@
 """Allow running as `python -m soccer_diagrams.server`."""
 
-from .server import main
 import asyncio
 
+from .server import main
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # stdio traffic still works on the default loop
+    pass
+
 asyncio.run(main())
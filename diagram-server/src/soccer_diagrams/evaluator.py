@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from sys import intern
 from typing import Optional
 
 
@@ -32,20 +34,26 @@ class SessionEvaluation:
     intensity_profile: list[str]
 
 
+# Categories are interned so the per-session distinctness set compares
+# them by identity.
 THRESHOLDS = [
-    (20, "very_tight", "Very Tight — suited for 1v1/close-quarters technique drills"),
-    (50, "possession", "Possession — good for rondos, small-sided possession games"),
-    (100, "game_like", "Game-Like — realistic match spacing, SSGs"),
-    (200, "transitions", "Transitions — good for counter-attacks, transition exercises"),
-    (float("inf"), "fitness", "Fitness/Open — large area, consider if players need more constraint"),
+    (20, intern("very_tight"), "Very Tight — suited for 1v1/close-quarters technique drills"),
+    (50, intern("possession"), "Possession — good for rondos, small-sided possession games"),
+    (100, intern("game_like"), "Game-Like — realistic match spacing, SSGs"),
+    (200, intern("transitions"), "Transitions — good for counter-attacks, transition exercises"),
+    (float("inf"), intern("fitness"), "Fitness/Open — large area, consider if players need more constraint"),
 ]
 
 
+# Precomputed for binary search: keys are the upper bounds, values the
+# (category, description) pairs at the same index.
+_THRESHOLD_KEYS = [t[0] for t in THRESHOLDS]
+_THRESHOLD_VALS = [(t[1], t[2]) for t in THRESHOLDS]
+
+
 def _categorize(area_per_player: float) -> tuple[str, str]:
-    for threshold, category, description in THRESHOLDS:
-        if area_per_player < threshold:
-            return category, description
-    return "fitness", THRESHOLDS[-1][2]
+    index = bisect_right(_THRESHOLD_KEYS, area_per_player)
+    return _THRESHOLD_VALS[min(index, len(_THRESHOLD_VALS) - 1)]
 
 
 def _recommend(activity: ActivityInput, area_per_player: float, category: str) -> list[str]:
@@ -90,6 +98,8 @@ def evaluate_session(
 ) -> SessionEvaluation:
     results = []
     intensity_profile = []
+    categories = set()
+    all_high = True
     for act_data in activities:
         act = ActivityInput(
             name=act_data["name"],
@@ -105,15 +115,17 @@ def evaluate_session(
             f"{act.name}: {act.intensity or 'medium'} intensity, "
             f"{act.duration_minutes}min, {metrics.category}"
         )
+        categories.add(metrics.category)
+        if act.intensity and act.intensity != "high":
+            all_high = False
 
     overall = []
-    categories = [r.category for r in results]
-    if len(set(categories)) == 1:
+    if len(categories) == 1:
         overall.append(
             "All activities use similar spacing. Consider varying area sizes "
             "to challenge players differently."
         )
-    if all(a.get("intensity") == "high" for a in activities if a.get("intensity")):
+    if all_high:
         overall.append(
             "All activities are high intensity. Include recovery or technical "
             "activities to manage load."
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import os
+import re
+from collections.abc import Iterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from reportlab.lib import colors
@@ -20,7 +23,9 @@ from reportlab.platypus import (
 )
 
 
+@lru_cache(maxsize=1)
 def _get_styles():
+    """Build the stylesheet once; neither we nor reportlab mutate it."""
     styles = getSampleStyleSheet()
     styles.add(ParagraphStyle(
         "SessionTitle",
@@ -55,38 +60,56 @@ def _get_styles():
     return styles
 
 
-def _markdown_to_paragraphs(text: str, styles) -> list:
-    """Simple markdown-to-reportlab conversion for basic formatting."""
-    elements = []
+# Heading prefixes in most-specific-first order, mapped to style names.
+_HEADING_STYLES = (
+    ("### ", "SectionHead"),
+    ("## ", "SectionHead"),
+    ("# ", "SessionTitle"),
+)
+
+
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _format_emphasis(stripped: str) -> str:
+    """Convert **bold** markers to reportlab <b> tags."""
+    if "*" not in stripped:
+        return stripped
+    return _BOLD_RE.sub(r"<b>\1</b>", stripped)
+
+
+def _markdown_to_paragraphs(text: str, styles) -> Iterator:
+    """Simple markdown-to-reportlab conversion for basic formatting.
+
+    Yields flowables so callers can feed story.extend without an
+    intermediate list per section.
+    """
     for line in text.split("\n"):
         stripped = line.strip()
         if not stripped:
-            elements.append(Spacer(1, 6))
+            yield Spacer(1, 6)
             continue
-        if stripped.startswith("### "):
-            elements.append(Paragraph(stripped[4:], styles["SectionHead"]))
-        elif stripped.startswith("## "):
-            elements.append(Paragraph(stripped[3:], styles["SectionHead"]))
-        elif stripped.startswith("# "):
-            elements.append(Paragraph(stripped[2:], styles["SessionTitle"]))
-        elif stripped.startswith("- ") or stripped.startswith("* "):
-            bullet_text = f"• {stripped[2:]}"
-            elements.append(Paragraph(bullet_text, styles["BodyText2"]))
+        # Dispatch on the first character so plain prose lines (the common
+        # case) skip the prefix tests entirely.
+        first = stripped[0]
+        if first == "#":
+            for prefix, style_name in _HEADING_STYLES:
+                if stripped.startswith(prefix):
+                    yield Paragraph(stripped[len(prefix):], styles[style_name])
+                    break
+            else:
+                yield Paragraph(_format_emphasis(stripped), styles["BodyText2"])
+        elif first in "-*" and stripped[1:2] == " ":
+            yield Paragraph(f"• {stripped[2:]}", styles["BodyText2"])
         else:
-            # Bold markers
-            processed = stripped.replace("**", "<b>", 1)
-            while "**" in processed:
-                processed = processed.replace("**", "</b>", 1)
-                if "**" in processed:
-                    processed = processed.replace("**", "<b>", 1)
-            elements.append(Paragraph(processed, styles["BodyText2"]))
-    return elements
+            yield Paragraph(_format_emphasis(stripped), styles["BodyText2"])
 
 
 def compile_pdf(
     title: str,
     sections: list[dict],
     output_path: str | None = None,
+    fast: bool = False,
 ) -> str:
     """Compile sections into a PDF.
 
@@ -95,6 +118,9 @@ def compile_pdf(
       - content: markdown text or image file path
       - caption: optional caption (for images)
 
+    Set fast=True to skip page-stream compression, trading larger files
+    for a quicker build (useful for batch generation).
+
     Returns the output file path.
     """
     if output_path is None:
@@ -114,6 +140,7 @@ def compile_pdf(
         rightMargin=20 * mm,
         topMargin=20 * mm,
         bottomMargin=20 * mm,
+        pageCompression=0 if fast else 1,
     )
 
     story = []
@@ -125,7 +152,7 @@ def compile_pdf(
             story.extend(_markdown_to_paragraphs(section["content"], styles))
         elif section["type"] == "image":
             img_path = section["content"]
-            if os.path.exists(img_path):
+            if os.path.isfile(img_path):
                 # Fit image to page width
                 max_width = A4[0] - 40 * mm
                 img = Image(img_path, width=max_width, height=max_width * 0.6)
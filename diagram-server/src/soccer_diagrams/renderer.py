@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import itertools
 import os
-from datetime import datetime
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 
 import matplotlib
@@ -12,7 +15,11 @@ matplotlib.use("Agg")
 
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection, PatchCollection, PolyCollection
+from matplotlib.colors import to_rgba
 from mplsoccer import Pitch
+from PIL import Image
 
 from .schema import (
     ActionType,
@@ -37,6 +44,28 @@ MARKER_SHAPES = {
     MarkerType.dot: ".",
 }
 
+MARKER_SIZES = {
+    MarkerType.jersey: 300,
+    MarkerType.cone: 150,
+    MarkerType.ball: 150,
+    MarkerType.dot: 150,
+}
+
+# Shared label kwargs, hoisted so the per-label loops don't rebuild the
+# same dicts on every call
+ZONE_LABEL_KWARGS = dict(
+    ha="center", va="center", fontsize=9, color="white", fontweight="bold",
+)
+PLAYER_LABEL_KWARGS = dict(
+    textcoords="offset points", xytext=(0, 10), ha="center",
+    fontsize=8, color="white", fontweight="bold", zorder=6,
+)
+ACTION_LABEL_KWARGS = dict(fontsize=7, ha="center", va="bottom", zorder=6)
+
+# Arrowhead triangle dimensions, in pitch (data) coordinates
+ARROW_HEAD_LENGTH = 2.0
+ARROW_HEAD_WIDTH = 1.0
+
 ACTION_STYLES = {
     ActionType.pass_: {"linestyle": "-", "color": "#1565C0"},
     ActionType.run: {"linestyle": "--", "color": "#2E7D32"},
@@ -46,14 +75,83 @@ ACTION_STYLES = {
 }
 
 
+@lru_cache(maxsize=None)
 def _get_pitch(view: PitchView) -> Pitch:
-    if view == PitchView.half:
+    if view is PitchView.half:
         return Pitch(half=True, pitch_color="grass", line_color="white")
-    if view == PitchView.attacking_third:
+    if view is PitchView.attacking_third:
         return Pitch(half=True, pitch_color="grass", line_color="white")
     return Pitch(pitch_color="grass", line_color="white")
 
 
+# Figure/Axes reuse: creating and tearing down a figure (and redrawing the
+# pitch) per render dominates the cost of small drills, so keep one warm
+# figure per view and strip the drill-specific artists after each save.
+# matplotlib is not thread-safe, so rendering is serialized by a lock.
+_ARTIST_GROUPS = ("collections", "patches", "lines", "texts", "artists")
+_FIG_CACHE: dict[PitchView, tuple] = {}
+_RENDER_LOCK = threading.Lock()
+
+# Output directories already created, so repeat renders skip the mkdir stat
+_ENSURED_DIRS: set[str] = set()
+
+# Per-process sequence for output filenames: warm renders finish in well
+# under a second, so a timestamp alone can collide for same-title drills
+# (and across pool workers); pid + sequence keeps names unique.
+_FILE_SEQ = itertools.count()
+
+# PNG compression level (libpng 0-9). Level 1 costs a fraction of the
+# default 6 on line-art diagrams for a few percent larger files; operators
+# can trade CPU for bytes via the environment.
+_PNG_COMPRESS = int(os.environ.get("SOCCER_DIAGRAM_PNG_COMPRESS", "1"))
+
+
+def _get_figure(view: PitchView) -> tuple:
+    """Return (fig, ax, baseline) for a view, creating and caching on first use.
+
+    baseline maps artist-group name to the artists the bare pitch owns;
+    anything added on top of it is removed again by _clear_transient.
+    """
+    cached = _FIG_CACHE.get(view)
+    if cached is None:
+        pitch = _get_pitch(view)
+        fig, ax = pitch.draw(figsize=(12, 8))
+        # Match the 150 dpi the save path always used, so the raw Agg
+        # buffer comes out at the same resolution as savefig(dpi=150).
+        fig.set_dpi(150)
+        # Lay the figure out once here so savefig can skip the extra
+        # measuring pass bbox_inches="tight" would do on every call. A
+        # placeholder title reserves headroom at the real title's size.
+        ax.set_title(" ", fontsize=16, fontweight="bold", pad=12)
+        fig.tight_layout()
+        baseline = {group: list(getattr(ax, group)) for group in _ARTIST_GROUPS}
+        cached = (fig, ax, baseline)
+        _FIG_CACHE[view] = cached
+    return cached
+
+
+def warmup() -> None:
+    """Pre-build the cached figure for every pitch view.
+
+    Forces matplotlib's font resolution, the Agg backend, and the pitch
+    draw to happen ahead of the first real render; safe to call more
+    than once.
+    """
+    with _RENDER_LOCK:
+        for view in PitchView:
+            fig, _, _ = _get_figure(view)
+            fig.canvas.draw()
+
+
+def _clear_transient(ax, baseline: dict) -> None:
+    """Remove every artist added since the pitch baseline was captured."""
+    for group in _ARTIST_GROUPS:
+        keep = baseline[group]
+        for artist in list(getattr(ax, group)):
+            if artist not in keep:
+                artist.remove()
+
+
 def _resolve_target(action, elements_by_id: dict) -> tuple[float, float] | None:
     if action.to_id and action.to_id in elements_by_id:
         target = elements_by_id[action.to_id]
@@ -65,71 +163,97 @@ def _resolve_target(action, elements_by_id: dict) -> tuple[float, float] | None:
 
 def render(drill: DrillDefinition, fmt: str = "png", output_dir: str = "output/diagrams") -> str:
     """Render a drill definition to an image file. Returns the file path."""
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    if output_dir not in _ENSURED_DIRS:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(output_dir)
+
+    with _RENDER_LOCK:
+        fig, ax, baseline = _get_figure(drill.meta.pitch_view)
+        try:
+            return _draw_and_save(drill, fig, ax, fmt, output_dir)
+        finally:
+            _clear_transient(ax, baseline)
+
+
+def render_many(
+    drills: list[DrillDefinition],
+    fmt: str = "png",
+    output_dir: str = "output/diagrams",
+) -> list[str]:
+    """Render several drills in one call. Returns the file paths.
 
-    pitch = _get_pitch(drill.meta.pitch_view)
-    fig, ax = pitch.draw(figsize=(12, 8))
+    Everything shares the warm figure cache, so a batch pays matplotlib
+    and pitch setup once rather than per drill (or, via the MCP server,
+    one executor round-trip instead of one per drill).
+    """
+    return [render(drill, fmt=fmt, output_dir=output_dir) for drill in drills]
+
+
+def _draw_and_save(drill: DrillDefinition, fig, ax, fmt: str, output_dir: str) -> str:
     ax.set_title(drill.meta.title, fontsize=16, fontweight="bold", pad=12)
 
     elements_by_id: dict = {e.id: e for e in drill.elements}
 
-    # Draw zones first (background)
+    # Draw zones first (background), collected into a single
+    # PatchCollection so each zone skips its own add_patch/limit-update
+    # pass; per-zone alpha folds into the RGBA facecolor.
+    zone_patches = []
+    zone_colors = []
+    zone_labels = []
     for zone in drill.zones:
-        if zone.type == ZoneType.rect and zone.width and zone.height:
-            rect = mpatches.FancyBboxPatch(
+        if zone.type is ZoneType.rect and zone.width and zone.height:
+            zone_patches.append(mpatches.FancyBboxPatch(
                 (zone.x, zone.y),
                 zone.width,
                 zone.height,
                 boxstyle="round,pad=1",
-                facecolor=zone.color or "#2196F3",
-                alpha=zone.alpha,
-                edgecolor="none",
-            )
-            ax.add_patch(rect)
+            ))
+            zone_colors.append(to_rgba(zone.color or "#2196F3", zone.alpha))
             if zone.label:
-                ax.text(
-                    zone.x + zone.width / 2,
-                    zone.y + zone.height / 2,
-                    zone.label,
-                    ha="center",
-                    va="center",
-                    fontsize=9,
-                    color="white",
-                    fontweight="bold",
+                zone_labels.append(
+                    (zone.x + zone.width / 2, zone.y + zone.height / 2, zone.label)
                 )
-        elif zone.type == ZoneType.circle and zone.radius:
-            circle = mpatches.Circle(
-                (zone.x, zone.y),
-                zone.radius,
-                facecolor=zone.color or "#2196F3",
-                alpha=zone.alpha,
-                edgecolor="none",
-            )
-            ax.add_patch(circle)
+        elif zone.type is ZoneType.circle and zone.radius:
+            zone_patches.append(mpatches.Circle((zone.x, zone.y), zone.radius))
+            zone_colors.append(to_rgba(zone.color or "#2196F3", zone.alpha))
             if zone.label:
-                ax.text(
-                    zone.x, zone.y, zone.label,
-                    ha="center", va="center", fontsize=9,
-                    color="white", fontweight="bold",
-                )
+                zone_labels.append((zone.x, zone.y, zone.label))
 
-    # Draw players
+    if zone_patches:
+        ax.add_collection(PatchCollection(
+            zone_patches, facecolors=zone_colors, edgecolors="none", zorder=1,
+        ))
+    for x, y, text in zone_labels:
+        ax.text(x, y, text, **ZONE_LABEL_KWARGS)
+
+    # Draw players, batched into one scatter (one PathCollection) per
+    # marker shape instead of one per element
+    marker_groups: dict[str, dict[str, list]] = {}
     for elem in drill.elements:
-        color = elem.color or TEAM_COLORS.get(elem.team, "#333333")
         marker = MARKER_SHAPES.get(elem.marker, "o")
-        size = 300 if elem.marker == MarkerType.jersey else 150
+        group = marker_groups.setdefault(marker, {"x": [], "y": [], "c": [], "s": []})
+        group["x"].append(elem.x)
+        group["y"].append(elem.y)
+        group["c"].append(elem.color or TEAM_COLORS.get(elem.team, "#333333"))
+        group["s"].append(MARKER_SIZES.get(elem.marker, 150))
 
-        ax.scatter(elem.x, elem.y, s=size, c=color, marker=marker,
+    for marker, group in marker_groups.items():
+        ax.scatter(group["x"], group["y"], s=group["s"], c=group["c"], marker=marker,
                    edgecolors="white", linewidths=1.5, zorder=5)
+
+    for elem in drill.elements:
         if elem.label:
-            ax.annotate(
-                elem.label, (elem.x, elem.y),
-                textcoords="offset points", xytext=(0, 10),
-                ha="center", fontsize=8, color="white",
-                fontweight="bold", zorder=6,
-            )
+            ax.annotate(elem.label, (elem.x, elem.y), **PLAYER_LABEL_KWARGS)
 
-    # Draw actions
+    # Draw actions. Straight actions are batched into one LineCollection
+    # (shafts) plus one PolyCollection (arrowhead triangles), with the
+    # segment/head/midpoint geometry computed in one NumPy pass; curved
+    # runs keep the per-action annotate since arc geometry has no
+    # collection form.
+    endpoints = []
+    seg_colors = []
+    seg_styles = []
+    labels = []
     for action in drill.actions:
         if action.from_id not in elements_by_id:
             continue
@@ -141,7 +265,7 @@ def render(drill: DrillDefinition, fmt: str = "png", output_dir: str = "output/d
         style = ACTION_STYLES.get(action.type, ACTION_STYLES[ActionType.pass_])
         color = action.color or style["color"]
 
-        if action.type == ActionType.curved_run:
+        if action.type is ActionType.curved_run:
             ax.annotate(
                 "", xy=target, xytext=(source.x, source.y),
                 arrowprops=dict(
@@ -152,27 +276,55 @@ def render(drill: DrillDefinition, fmt: str = "png", output_dir: str = "output/d
                 zorder=4,
             )
         else:
-            ax.annotate(
-                "", xy=target, xytext=(source.x, source.y),
-                arrowprops=dict(
-                    arrowstyle="->", color=color, lw=2,
-                    linestyle=style["linestyle"],
-                ),
-                zorder=4,
-            )
+            endpoints.append((source.x, source.y, target[0], target[1]))
+            seg_colors.append(color)
+            seg_styles.append(style["linestyle"])
 
         if action.label:
             mid_x = (source.x + target[0]) / 2
             mid_y = (source.y + target[1]) / 2
-            ax.text(mid_x, mid_y, action.label, fontsize=7,
-                    ha="center", va="bottom", color=color, zorder=6)
+            labels.append((mid_x, mid_y, action.label, color))
+
+    if endpoints:
+        ends = np.asarray(endpoints)
+        src, tgt = ends[:, :2], ends[:, 2:]
+        delta = tgt - src
+        lengths = np.hypot(delta[:, 0], delta[:, 1])
+        valid = lengths > 0
+        if valid.any():
+            src, tgt, delta = src[valid], tgt[valid], delta[valid]
+            unit = delta / lengths[valid, None]
+            base = tgt - ARROW_HEAD_LENGTH * unit
+            perp = ARROW_HEAD_WIDTH * np.stack([-unit[:, 1], unit[:, 0]], axis=1)
+            segments = np.stack([src, base], axis=1)
+            heads = np.stack([tgt, base + perp, base - perp], axis=1)
+            colors = [c for c, v in zip(seg_colors, valid) if v]
+            styles = [s for s, v in zip(seg_styles, valid) if v]
+            ax.add_collection(LineCollection(
+                segments, colors=colors, linestyles=styles,
+                linewidths=2, zorder=4,
+            ))
+            ax.add_collection(PolyCollection(
+                heads, facecolors=colors, edgecolors="none", zorder=4,
+            ))
+
+    for mid_x, mid_y, text, color in labels:
+        ax.text(mid_x, mid_y, text, color=color, **ACTION_LABEL_KWARGS)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     safe_title = drill.meta.title.replace(" ", "_")[:30]
-    filename = f"{safe_title}_{timestamp}.{fmt}"
+    filename = f"{safe_title}_{timestamp}_{os.getpid()}_{next(_FILE_SEQ)}.{fmt}"
     filepath = os.path.join(output_dir, filename)
 
-    fig.savefig(filepath, dpi=150, bbox_inches="tight", facecolor=fig.get_facecolor())
-    plt.close(fig)
+    if fmt == "png":
+        # Dump the Agg buffer straight through Pillow: this skips
+        # savefig's print_figure stack and libpng's default level-6
+        # compression, which together dominate PNG save time.
+        fig.canvas.draw()
+        width, height = fig.canvas.get_width_height()
+        image = Image.frombuffer("RGBA", (width, height), fig.canvas.buffer_rgba())
+        image.save(filepath, "PNG", compress_level=_PNG_COMPRESS)
+    else:
+        fig.savefig(filepath, dpi=150, facecolor=fig.get_facecolor())
 
     return filepath
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import multiprocessing
 import os
-from dataclasses import asdict
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json remains the fallback
+    orjson = None
 
 from .evaluator import evaluate_session
 from .pdf_builder import compile_pdf
-from .renderer import render
+from .renderer import render, render_many, warmup
 from .schema import DrillDefinition
 from .table_fixer import fix_text_file, format_text_file
 from .text_to_pdf import text_to_pdf, batch_text_to_pdf
@@ -25,200 +36,357 @@ DIAGRAMS_DIR = os.path.join(PROJECT_ROOT, "output", "diagrams")
 PDFS_DIR = os.path.join(PROJECT_ROOT, "output", "pdfs")
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, "output")
 
+# Rendering runs in worker processes so savefig doesn't block the event
+# loop (matplotlib serializes on a lock per process anyway). Created
+# lazily so importing the server stays cheap.
+_render_pool: ProcessPoolExecutor | None = None
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    return [
-        Tool(
-            name="render_tactical_diagram",
-            description=(
-                "Render a soccer tactical diagram from a DrillDefinition. "
-                "Draws a pitch with players, movement arrows, and zones using mplsoccer. "
-                "Returns the path to the saved image."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drill": {
+# Built once: resolving field metadata per validation is the expensive part
+_DRILL_ADAPTER = TypeAdapter(DrillDefinition)
+
+# Rendering is a pure function of (drill, format), so identical requests
+# can reuse the file already on disk. Keyed by a blake2b digest of the
+# canonical drill JSON plus the format.
+_RENDER_CACHE: OrderedDict[str, str] = OrderedDict()
+_RENDER_CACHE_MAX = 512
+
+
+def _dumps(obj, indent: bool = False) -> str:
+    """Serialize a tool response, via orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+@lru_cache(maxsize=256)
+def _validate_drill(payload_json: str) -> DrillDefinition:
+    """Validate a canonical-JSON drill payload, memoized.
+
+    Iterative clients re-send the same drill repeatedly; caching on the
+    canonical JSON makes repeat validations free.
+    """
+    return _DRILL_ADAPTER.validate_json(payload_json)
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    global _render_pool
+    if _render_pool is None:
+        # spawn, not fork: forking the process that owns the running event
+        # loop (and the stdio transport) deadlocks in the child; spawned
+        # workers import matplotlib once and stay warm.
+        _render_pool = ProcessPoolExecutor(
+            # each warm worker holds matplotlib plus the cached pitch
+            # figures, so cap the pool well below big-host core counts
+            max_workers=min(4, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warmup,
+        )
+    return _render_pool
+
+
+# Tool schemas are constants; build the list once at import instead of
+# reconstructing every Tool object on each list_tools request.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="render_tactical_diagram",
+        description=(
+            "Render a soccer tactical diagram from a DrillDefinition. "
+            "Draws a pitch with players, movement arrows, and zones using mplsoccer. "
+            "Returns the path to the saved image."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drill": {
+                    "type": "object",
+                    "description": "DrillDefinition object with meta, elements, actions, zones",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["png", "pdf"],
+                    "default": "png",
+                    "description": "Output image format",
+                },
+            },
+            "required": ["drill"],
+        },
+    ),
+    Tool(
+        name="render_tactical_diagrams",
+        description=(
+            "Render several soccer tactical diagrams in one call. "
+            "Same drawing pipeline as render_tactical_diagram, but the whole "
+            "batch shares one warm rendering context. Returns the saved image "
+            "paths in input order."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drills": {
+                    "type": "array",
+                    "items": {
                         "type": "object",
                         "description": "DrillDefinition object with meta, elements, actions, zones",
                     },
-                    "format": {
-                        "type": "string",
-                        "enum": ["png", "pdf"],
-                        "default": "png",
-                        "description": "Output image format",
-                    },
+                    "description": "List of DrillDefinition objects",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["png", "pdf"],
+                    "default": "png",
+                    "description": "Output image format",
                 },
-                "required": ["drill"],
             },
+            "required": ["drills"],
+        },
+    ),
+    Tool(
+        name="batch_text_to_pdf",
+        description=(
+            "Convert every matching text file in a directory to PDF with the "
+            "same fixed-width formatting rules as text_to_pdf. Returns a "
+            "per-file status list."
         ),
-        Tool(
-            name="evaluate_session_plan",
-            description=(
-                "Evaluate spatial and intensity metrics for a session plan. "
-                "Calculates area-per-player for each activity and provides recommendations. "
-                "Thresholds: <20m²=very tight, 20-50=possession, 50-100=game-like, "
-                "100-200=transitions, >200=fitness."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pitch_length": {"type": "number", "description": "Pitch length in meters"},
-                    "pitch_width": {"type": "number", "description": "Pitch width in meters"},
-                    "num_players": {"type": "integer", "description": "Total number of players"},
-                    "activities": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "area_length": {"type": "number"},
-                                "area_width": {"type": "number"},
-                                "num_players": {"type": "integer"},
-                                "duration_minutes": {"type": "number"},
-                                "intensity": {"type": "string", "enum": ["low", "medium", "high"]},
-                            },
-                            "required": ["name"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_dir": {
+                    "type": "string",
+                    "description": "Directory containing the text files",
+                },
+                "output_dir": {
+                    "type": "string",
+                    "description": "Optional output directory. Defaults to the input directory.",
+                },
+                "pattern": {
+                    "type": "string",
+                    "default": "*.txt",
+                    "description": "Glob pattern for input files",
+                },
+            },
+            "required": ["input_dir"],
+        },
+    ),
+    Tool(
+        name="evaluate_session_plan",
+        description=(
+            "Evaluate spatial and intensity metrics for a session plan. "
+            "Calculates area-per-player for each activity and provides recommendations. "
+            "Thresholds: <20m²=very tight, 20-50=possession, 50-100=game-like, "
+            "100-200=transitions, >200=fitness."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pitch_length": {"type": "number", "description": "Pitch length in meters"},
+                "pitch_width": {"type": "number", "description": "Pitch width in meters"},
+                "num_players": {"type": "integer", "description": "Total number of players"},
+                "activities": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "area_length": {"type": "number"},
+                            "area_width": {"type": "number"},
+                            "num_players": {"type": "integer"},
+                            "duration_minutes": {"type": "number"},
+                            "intensity": {"type": "string", "enum": ["low", "medium", "high"]},
                         },
-                        "description": "List of activities in the session",
+                        "required": ["name"],
                     },
+                    "description": "List of activities in the session",
                 },
-                "required": ["pitch_length", "pitch_width", "num_players", "activities"],
             },
+            "required": ["pitch_length", "pitch_width", "num_players", "activities"],
+        },
+    ),
+    Tool(
+        name="compile_to_pdf",
+        description=(
+            "Compile a session plan with text and images into a PDF document. "
+            "Accepts markdown text sections and image paths. Returns the PDF file path."
         ),
-        Tool(
-            name="compile_to_pdf",
-            description=(
-                "Compile a session plan with text and images into a PDF document. "
-                "Accepts markdown text sections and image paths. Returns the PDF file path."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "PDF document title"},
-                    "sections": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "type": {
-                                    "type": "string",
-                                    "enum": ["markdown", "image"],
-                                },
-                                "content": {
-                                    "type": "string",
-                                    "description": "Markdown text or image file path",
-                                },
-                                "caption": {
-                                    "type": "string",
-                                    "description": "Optional caption for images",
-                                },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "PDF document title"},
+                "sections": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "type": {
+                                "type": "string",
+                                "enum": ["markdown", "image"],
+                            },
+                            "content": {
+                                "type": "string",
+                                "description": "Markdown text or image file path",
+                            },
+                            "caption": {
+                                "type": "string",
+                                "description": "Optional caption for images",
                             },
-                            "required": ["type", "content"],
                         },
-                        "description": "Ordered list of content sections",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Optional output file path. Defaults to output/pdfs/",
+                        "required": ["type", "content"],
                     },
+                    "description": "Ordered list of content sections",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Optional output file path. Defaults to output/pdfs/",
                 },
-                "required": ["title", "sections"],
             },
+            "required": ["title", "sections"],
+        },
+    ),
+    Tool(
+        name="text_to_pdf",
+        description=(
+            "Convert a fixed-width text file to PDF with exact formatting preservation. "
+            "Uses a monospace font to maintain alignment of tables and ASCII art. "
+            "Automatically adjusts font size if lines are too long, and switches to "
+            "landscape mode if needed. Won't overwrite existing files - adds version "
+            "numbers instead (e.g., file_v1.pdf, file_v2.pdf)."
         ),
-        Tool(
-            name="text_to_pdf",
-            description=(
-                "Convert a fixed-width text file to PDF with exact formatting preservation. "
-                "Uses a monospace font to maintain alignment of tables and ASCII art. "
-                "Automatically adjusts font size if lines are too long, and switches to "
-                "landscape mode if needed. Won't overwrite existing files - adds version "
-                "numbers instead (e.g., file_v1.pdf, file_v2.pdf)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input_path": {
-                        "type": "string",
-                        "description": "Path to the input text file",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": (
-                            "Optional output path. If not specified, uses the same name "
-                            "with .pdf extension in the output/ folder."
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_path": {
+                    "type": "string",
+                    "description": "Path to the input text file",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": (
+                        "Optional output path. If not specified, uses the same name "
+                        "with .pdf extension in the output/ folder."
+                    ),
                 },
-                "required": ["input_path"],
             },
+            "required": ["input_path"],
+        },
+    ),
+    Tool(
+        name="fix_table_alignment",
+        description=(
+            "Fix alignment issues in ASCII tables within a text file. "
+            "Detects tables using box-drawing characters and ensures all data rows "
+            "match the width of border rows by adding or removing padding. "
+            "Call this after generating text files with tables to fix any misalignment. "
+            "By default, fixes the file in place."
         ),
-        Tool(
-            name="fix_table_alignment",
-            description=(
-                "Fix alignment issues in ASCII tables within a text file. "
-                "Detects tables using box-drawing characters and ensures all data rows "
-                "match the width of border rows by adding or removing padding. "
-                "Call this after generating text files with tables to fix any misalignment. "
-                "By default, fixes the file in place."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input_path": {
-                        "type": "string",
-                        "description": "Path to the text file to fix",
-                    },
-                    "in_place": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "If true, overwrite the input file. If false, create a new file with '_fixed' suffix.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_path": {
+                    "type": "string",
+                    "description": "Path to the text file to fix",
+                },
+                "in_place": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "If true, overwrite the input file. If false, create a new file with '_fixed' suffix.",
                 },
-                "required": ["input_path"],
             },
+            "required": ["input_path"],
+        },
+    ),
+    Tool(
+        name="format_text_file",
+        description=(
+            "Format a text file by fixing table alignment AND wrapping long lines. "
+            "Tables are aligned to match border widths. Non-table lines longer than "
+            "the widest table are wrapped to fit. Reports unfixable issues (like "
+            "content too long for columns) that need manual attention."
         ),
-        Tool(
-            name="format_text_file",
-            description=(
-                "Format a text file by fixing table alignment AND wrapping long lines. "
-                "Tables are aligned to match border widths. Non-table lines longer than "
-                "the widest table are wrapped to fit. Reports unfixable issues (like "
-                "content too long for columns) that need manual attention."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input_path": {
-                        "type": "string",
-                        "description": "Path to the text file to format",
-                    },
-                    "in_place": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "If true, overwrite the input file. If false, create a new file with '_formatted' suffix.",
-                    },
-                    "max_width": {
-                        "type": "integer",
-                        "description": "Maximum line width. If not specified, uses the widest table in the file.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_path": {
+                    "type": "string",
+                    "description": "Path to the text file to format",
+                },
+                "in_place": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "If true, overwrite the input file. If false, create a new file with '_formatted' suffix.",
+                },
+                "max_width": {
+                    "type": "integer",
+                    "description": "Maximum line width. If not specified, uses the widest table in the file.",
                 },
-                "required": ["input_path"],
             },
-        ),
-    ]
+            "required": ["input_path"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    return _TOOLS
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     if name == "render_tactical_diagram":
-        drill = DrillDefinition.model_validate(arguments["drill"])
+        canonical = json.dumps(arguments["drill"], sort_keys=True, separators=(",", ":"))
+        drill = _validate_drill(canonical)
         fmt = arguments.get("format", "png")
-        image_path = render(drill, fmt=fmt, output_dir=DIAGRAMS_DIR)
+
+        cache_key = hashlib.blake2b(
+            (canonical + fmt).encode(), digest_size=16
+        ).hexdigest()
+        image_path = _RENDER_CACHE.get(cache_key)
+        if image_path is not None and os.path.exists(image_path):
+            _RENDER_CACHE.move_to_end(cache_key)
+        else:
+            loop = asyncio.get_running_loop()
+            image_path = await loop.run_in_executor(
+                _get_render_pool(),
+                partial(render, drill, fmt=fmt, output_dir=DIAGRAMS_DIR),
+            )
+            _RENDER_CACHE[cache_key] = image_path
+            if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+                _RENDER_CACHE.popitem(last=False)
         return [TextContent(
             type="text",
-            text=json.dumps({"image_path": image_path, "title": drill.meta.title}),
+            text=_dumps({"image_path": image_path, "title": drill.meta.title}),
+        )]
+
+    elif name == "render_tactical_diagrams":
+        drills = [
+            _validate_drill(json.dumps(d, sort_keys=True, separators=(",", ":")))
+            for d in arguments["drills"]
+        ]
+        fmt = arguments.get("format", "png")
+        loop = asyncio.get_running_loop()
+        image_paths = await loop.run_in_executor(
+            _get_render_pool(),
+            partial(render_many, drills, fmt=fmt, output_dir=DIAGRAMS_DIR),
+        )
+        return [TextContent(
+            type="text",
+            text=_dumps({"image_paths": image_paths}),
+        )]
+
+    elif name == "batch_text_to_pdf":
+        input_dir = arguments["input_dir"]
+        if not os.path.isabs(input_dir):
+            input_dir = os.path.join(OUTPUT_DIR, input_dir)
+
+        output_dir = arguments.get("output_dir")
+        if output_dir is not None and not os.path.isabs(output_dir):
+            output_dir = os.path.join(OUTPUT_DIR, output_dir)
+
+        pattern = arguments.get("pattern", "*.txt")
+        results = await asyncio.to_thread(batch_text_to_pdf, input_dir, output_dir, pattern)
+        return [TextContent(
+            type="text",
+            text=_dumps({"results": results}, indent=True),
         )]
 
     elif name == "evaluate_session_plan":
@@ -229,29 +397,30 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             activities=arguments["activities"],
         )
         output = {
-            "activities": [asdict(a) for a in result.activities],
+            # vars() instead of dataclasses.asdict: the dicts are consumed
+            # immediately by the serializer, so asdict's deep copy is waste
+            "activities": [vars(a) for a in result.activities],
             "overall_recommendations": result.overall_recommendations,
             "intensity_profile": result.intensity_profile,
         }
-        return [TextContent(type="text", text=json.dumps(output, indent=2))]
+        return [TextContent(type="text", text=_dumps(output, indent=True))]
 
     elif name == "compile_to_pdf":
-        output_path = arguments.get("output_path")
-        if output_path is None:
-            # Use default dir
-            pdf_path = compile_pdf(
-                title=arguments["title"],
-                sections=arguments["sections"],
-            )
-        else:
-            pdf_path = compile_pdf(
-                title=arguments["title"],
-                sections=arguments["sections"],
-                output_path=output_path,
-            )
+        # reportlab builds are CPU-heavy; run them alongside renders in
+        # the worker pool (output_path=None means the default dir)
+        loop = asyncio.get_running_loop()
+        pdf_path = await loop.run_in_executor(
+            _get_render_pool(),
+            partial(
+                compile_pdf,
+                arguments["title"],
+                arguments["sections"],
+                arguments.get("output_path"),
+            ),
+        )
         return [TextContent(
             type="text",
-            text=json.dumps({"pdf_path": pdf_path}),
+            text=_dumps({"pdf_path": pdf_path}),
         )]
 
     elif name == "text_to_pdf":
@@ -268,10 +437,10 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         elif not os.path.isabs(output_path):
             output_path = os.path.join(OUTPUT_DIR, output_path)
 
-        result_path = text_to_pdf(input_path, output_path)
+        result_path = await asyncio.to_thread(text_to_pdf, input_path, output_path)
         return [TextContent(
             type="text",
-            text=json.dumps({"pdf_path": result_path, "input_path": input_path}),
+            text=_dumps({"pdf_path": result_path, "input_path": input_path}),
         )]
 
     elif name == "fix_table_alignment":
@@ -280,10 +449,10 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             input_path = os.path.join(OUTPUT_DIR, input_path)
 
         in_place = arguments.get("in_place", True)
-        result = fix_text_file(input_path, in_place=in_place)
+        result = await asyncio.to_thread(fix_text_file, input_path, in_place=in_place)
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2),
+            text=_dumps(result, indent=True),
         )]
 
     elif name == "format_text_file":
@@ -293,10 +462,12 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
         in_place = arguments.get("in_place", True)
         max_width = arguments.get("max_width")
-        result = format_text_file(input_path, in_place=in_place, max_width=max_width)
+        result = await asyncio.to_thread(
+            format_text_file, input_path, in_place=in_place, max_width=max_width
+        )
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2),
+            text=_dumps(result, indent=True),
         )]
 
     else:
@@ -304,10 +475,18 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 
 async def main():
+    # Kick one render worker awake in the background so matplotlib import,
+    # font scanning, and the pitch figures are warm before the first
+    # render request instead of inflating its latency.
+    _get_render_pool().submit(warmup)
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
 
 
 if __name__ == "__main__":
-    import asyncio
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:  # stdio traffic still works on the default loop
+        pass
     asyncio.run(main())
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import fnmatch
+import multiprocessing
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from reportlab.lib.pagesizes import LETTER, landscape
@@ -17,6 +21,7 @@ from reportlab.pdfgen import canvas
 # Page margins
 MARGIN_MM = 15
 MARGIN = MARGIN_MM * mm
+_MARGIN_X2 = 2 * MARGIN
 
 # Default font size range
 DEFAULT_FONT_SIZE = 9
@@ -26,60 +31,57 @@ MAX_FONT_SIZE = 12
 # Threshold for switching to landscape mode
 LANDSCAPE_THRESHOLD_CHARS = 130
 
-# Font registration flag
-_font_registered = False
-MONO_FONT = "Courier"  # fallback
+# Compress content streams only for documents longer than this many
+# lines; for short notes the zlib CPU outweighs the few KB saved
+COMPRESSION_THRESHOLD_LINES = 200
+
+# Versioned-filename suffix, compiled once for _get_versioned_path
+_VERSION_RE = re.compile(r"(.+)_v(\d+)$")
 
+MONO_FONT = "Courier"  # fallback
 
+# Unicode-capable monospace font candidates for this platform, resolved
+# once at import so registration doesn't rebuild Path objects per call
+if sys.platform == "win32":
+    _FONT_CANDIDATES = (
+        ("C:/Windows/Fonts/consola.ttf", "Consolas"),
+        ("C:/Windows/Fonts/lucon.ttf", "LucidaConsole"),
+        ("C:/Windows/Fonts/cour.ttf", "CourierNew"),
+    )
+else:
+    # Linux/Mac paths
+    _FONT_CANDIDATES = (
+        ("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", "DejaVuSansMono"),
+        ("/usr/share/fonts/TTF/DejaVuSansMono.ttf", "DejaVuSansMono"),
+        ("/System/Library/Fonts/Monaco.ttf", "Monaco"),
+    )
+
+
+@lru_cache(maxsize=1)
 def _register_unicode_font() -> str:
     """Register a monospace font with Unicode box-drawing support.
 
-    Returns the font name to use.
+    Returns the font name to use; memoized, so repeat calls cost one
+    cache hit instead of a flag check on mutable module globals.
     """
-    global _font_registered, MONO_FONT
-
-    if _font_registered:
-        return MONO_FONT
-
-    # Try to find a Unicode-capable monospace font
-    font_candidates = []
-
-    if sys.platform == "win32":
-        fonts_dir = Path("C:/Windows/Fonts")
-        font_candidates = [
-            (fonts_dir / "consola.ttf", "Consolas"),
-            (fonts_dir / "lucon.ttf", "LucidaConsole"),
-            (fonts_dir / "cour.ttf", "CourierNew"),
-        ]
-    else:
-        # Linux/Mac paths
-        font_candidates = [
-            (Path("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"), "DejaVuSansMono"),
-            (Path("/usr/share/fonts/TTF/DejaVuSansMono.ttf"), "DejaVuSansMono"),
-            (Path("/System/Library/Fonts/Monaco.ttf"), "Monaco"),
-        ]
-
-    for font_path, font_name in font_candidates:
-        if font_path.exists():
+    for font_path, font_name in _FONT_CANDIDATES:
+        if os.path.isfile(font_path):
             try:
-                pdfmetrics.registerFont(TTFont(font_name, str(font_path)))
-                MONO_FONT = font_name
-                _font_registered = True
-                return MONO_FONT
+                pdfmetrics.registerFont(TTFont(font_name, font_path))
+                return font_name
             except Exception:
                 continue
 
     # Fallback to Courier (built-in, but no Unicode box chars)
-    _font_registered = True
     return MONO_FONT
 
 
-def _get_max_line_length(text: str) -> int:
-    """Find the longest line in the text."""
-    lines = text.split("\n")
-    return max(len(line) for line in lines) if lines else 0
+def _get_max_line_length(lines: list[str]) -> int:
+    """Find the longest line in the already-split text."""
+    return max(map(len, lines), default=0)
 
 
+@lru_cache(maxsize=128)
 def _calculate_font_size(
     max_line_chars: int,
     page_width: float,
@@ -112,21 +114,100 @@ def _get_versioned_path(base_path: str) -> str:
     parent = path.parent
 
     # Check for existing version number pattern
-    version_match = re.match(r"(.+)_v(\d+)$", stem)
+    version_match = _VERSION_RE.match(stem)
     if version_match:
         base_stem = version_match.group(1)
-        version = int(version_match.group(2))
     else:
         base_stem = stem
-        version = 0
 
-    # Find next available version
-    while True:
-        version += 1
-        new_name = f"{base_stem}_v{version}{suffix}"
-        new_path = parent / new_name
-        if not os.path.exists(new_path):
-            return str(new_path)
+    # One directory read instead of a stat probe per candidate version:
+    # collect the versions already on disk and go one past the highest.
+    existing_re = re.compile(
+        re.escape(base_stem) + r"_v(\d+)" + re.escape(suffix) + r"$"
+    )
+    version = 0
+    with os.scandir(parent if str(parent) else ".") as entries:
+        for entry in entries:
+            match = existing_re.match(entry.name)
+            if match:
+                version = max(version, int(match.group(1)))
+
+    return str(parent / f"{base_stem}_v{version + 1}{suffix}")
+
+
+def _choose_font(text: str) -> str:
+    """Pick the document font.
+
+    Pure-ASCII text renders with the built-in Courier - no TTF
+    registration, glyph subsetting, or font embedding at save time -
+    while anything with box drawing or other Unicode uses the registered
+    monospace font.
+    """
+    if text.isascii():
+        return MONO_FONT
+    return _register_unicode_font()
+
+
+def _read_text(input_path: str) -> str:
+    """Read a text file with one bulk read and a single C-level decode.
+
+    Keeps original Unicode characters and replicates TextIOWrapper's
+    universal-newline translation.
+    """
+    text = Path(input_path).read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _draw_text_document(c: canvas.Canvas, text: str, font_name: str) -> None:
+    """Draw one text document onto the canvas, ending its last page.
+
+    Chooses page size, orientation, and font size per document, so a
+    merged batch can mix portrait and landscape files on one canvas.
+    """
+    lines = text.split("\n")
+    max_line_chars = _get_max_line_length(lines)
+
+    # Compute both orientations up front (two cached divisions) and pick
+    # once: lines past the threshold, or a portrait font pinned at the
+    # minimum that landscape would improve, switch to landscape.
+    portrait_size = _calculate_font_size(max_line_chars, LETTER[0], MARGIN)
+    landscape_size = _calculate_font_size(max_line_chars, landscape(LETTER)[0], MARGIN)
+    use_landscape = max_line_chars > LANDSCAPE_THRESHOLD_CHARS or (
+        portrait_size <= MIN_FONT_SIZE and landscape_size > portrait_size
+    )
+
+    if use_landscape:
+        page_width, page_height = landscape(LETTER)
+        font_size = landscape_size
+    else:
+        page_width, page_height = LETTER
+        font_size = portrait_size
+
+    c.setPageSize((page_width, page_height))
+
+    # Calculate line height and lines per page
+    line_height = font_size * 1.2
+    usable_height = page_height - _MARGIN_X2
+    lines_per_page = max(1, int(usable_height / line_height))
+    y_start = page_height - MARGIN - font_size
+    total_lines = len(lines)
+
+    # Draw text one text object per page: a single BT/ET block with the
+    # leading applied by the text object replaces per-line drawString
+    # calls and their y bookkeeping. Pagination is a plain range over
+    # page starts, so there is no line counter to maintain.
+    for page_start in range(0, total_lines, lines_per_page):
+        text_obj = c.beginText(MARGIN, y_start)
+        text_obj.setFont(font_name, font_size)
+        text_obj.setLeading(line_height)
+        # Bind the bound method once; the line loop is the hot path
+        text_line = text_obj.textLine
+        for line in lines[page_start:page_start + lines_per_page]:
+            text_line(line)
+        c.drawText(text_obj)
+        c.showPage()
 
 
 def text_to_pdf(
@@ -143,15 +224,8 @@ def text_to_pdf(
     Returns:
         Path to the generated PDF file.
     """
-    # Register Unicode-capable font
-    font_name = _register_unicode_font()
-
-    # Read input file (keep original Unicode characters)
-    with open(input_path, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    lines = text.split("\n")
-    max_line_chars = _get_max_line_length(text)
+    text = _read_text(input_path)
+    font_name = _choose_font(text)
 
     # Determine output path
     if output_path is None:
@@ -164,58 +238,14 @@ def text_to_pdf(
     # Ensure output directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    # Switch to landscape if lines are long (> threshold) or font would be too small
-    use_landscape = max_line_chars > LANDSCAPE_THRESHOLD_CHARS
-
-    if use_landscape:
-        page_width, page_height = landscape(LETTER)
-    else:
-        page_width, page_height = LETTER
-
-    font_size = _calculate_font_size(max_line_chars, page_width, MARGIN)
-
-    # If still at minimum font size in portrait, try landscape
-    if not use_landscape and font_size <= MIN_FONT_SIZE:
-        landscape_width, landscape_height = landscape(LETTER)
-        landscape_font_size = _calculate_font_size(max_line_chars, landscape_width, MARGIN)
-        if landscape_font_size > font_size:
-            page_width, page_height = landscape_width, landscape_height
-            font_size = landscape_font_size
-            use_landscape = True
-
-    # Create PDF
-    c = canvas.Canvas(output_path, pagesize=(page_width, page_height))
-
-    # Calculate line height and lines per page
-    line_height = font_size * 1.2
-    usable_height = page_height - (2 * MARGIN)
-    lines_per_page = int(usable_height / line_height)
-
-    # Draw text
-    current_line = 0
-    total_lines = len(lines)
-
-    while current_line < total_lines:
-        # Start new page
-        y = page_height - MARGIN - font_size
-
-        # Draw lines for this page
-        page_line_count = 0
-        while current_line < total_lines and page_line_count < lines_per_page:
-            line = lines[current_line]
-
-            # Draw the line
-            c.setFont(font_name, font_size)
-            c.drawString(MARGIN, y, line)
-
-            y -= line_height
-            current_line += 1
-            page_line_count += 1
-
-        # Add new page if more content
-        if current_line < total_lines:
-            c.showPage()
-
+    use_compression = text.count("\n") + 1 > COMPRESSION_THRESHOLD_LINES
+    c = canvas.Canvas(output_path, pageCompression=1 if use_compression else 0)
+    _draw_text_document(c, text, font_name)
+    # Release the source text before save(): reportlab assembles the
+    # whole PDF in memory there, and holding a multi-MB input alongside
+    # it doubles peak RSS (the split line list already died with the
+    # draw helper)
+    del text
     c.save()
     return output_path
 
@@ -224,6 +254,8 @@ def batch_text_to_pdf(
     input_dir: str,
     output_dir: str | None = None,
     pattern: str = "*.txt",
+    merged: bool = False,
+    merged_output: str | None = None,
 ) -> list[dict]:
     """Convert all matching text files in a directory to PDF.
 
@@ -231,6 +263,11 @@ def batch_text_to_pdf(
         input_dir: Directory containing text files
         output_dir: Output directory for PDFs. If None, uses input_dir.
         pattern: Glob pattern for input files (default: *.txt)
+        merged: If True, write every document into one PDF (one canvas,
+                fonts embedded once) instead of one file per input.
+        merged_output: Output path for the merged PDF. Defaults to
+                       merged.pdf in the output directory; versioned if
+                       it already exists.
 
     Returns:
         List of dicts with input_path, output_path, and status for each file.
@@ -242,24 +279,88 @@ def batch_text_to_pdf(
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-    results = []
-    for txt_file in input_path.glob(pattern):
-        pdf_name = txt_file.stem + ".pdf"
-        target_path = output_path / pdf_name
+    # os.scandir + fnmatch instead of Path.glob: one readdir pass with
+    # plain strings, no Path object per entry. Dotfiles stay excluded to
+    # match glob's behavior.
+    jobs = []
+    with os.scandir(input_path) as entries:
+        for entry in entries:
+            if (
+                entry.is_file()
+                and not entry.name.startswith(".")
+                and fnmatch.fnmatch(entry.name, pattern)
+            ):
+                stem = os.path.splitext(entry.name)[0]
+                jobs.append((entry.path, str(output_path / (stem + ".pdf"))))
+    if not jobs:
+        return []
+
+    if merged:
+        return _merged_text_to_pdf(jobs, output_path, merged_output)
+
+    # Spawned workers each pay a fresh interpreter plus the reportlab
+    # import, which outweighs the conversion work for small batches.
+    if len(jobs) < 4:
+        return [_convert_one(*job) for job in jobs]
+
+    # Each conversion is independent and CPU-bound in reportlab, so fan
+    # the batch across worker processes. spawn, not fork: the MCP server
+    # calls this from a thread of a process that owns an event loop, and
+    # forking that deadlocks the child.
+    max_workers = min(4, os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        return list(pool.map(_convert_one, *zip(*jobs)))
+
+
+def _merged_text_to_pdf(
+    jobs: list[tuple[str, str]],
+    output_path: Path,
+    merged_output: str | None,
+) -> list[dict]:
+    """Draw every document onto one canvas, embedding fonts only once."""
+    if merged_output is None:
+        merged_output = str(output_path / "merged.pdf")
+    merged_output = _get_versioned_path(merged_output)
+    Path(merged_output).parent.mkdir(parents=True, exist_ok=True)
 
+    c = canvas.Canvas(merged_output)
+    results = []
+    for input_file, _ in jobs:
         try:
-            result_path = text_to_pdf(str(txt_file), str(target_path))
+            text = _read_text(input_file)
+            _draw_text_document(c, text, _choose_font(text))
             results.append({
-                "input_path": str(txt_file),
-                "output_path": result_path,
+                "input_path": input_file,
+                "output_path": merged_output,
                 "status": "success",
             })
         except Exception as e:
             results.append({
-                "input_path": str(txt_file),
-                "output_path": str(target_path),
+                "input_path": input_file,
+                "output_path": merged_output,
                 "status": "error",
                 "error": str(e),
             })
-
+    c.save()
     return results
+
+
+def _convert_one(input_path: str, target_path: str) -> dict:
+    """Convert one file, reporting failure as a result record."""
+    try:
+        result_path = text_to_pdf(input_path, target_path)
+        return {
+            "input_path": input_path,
+            "output_path": result_path,
+            "status": "success",
+        }
+    except Exception as e:
+        return {
+            "input_path": input_path,
+            "output_path": target_path,
+            "status": "error",
+            "error": str(e),
+        }
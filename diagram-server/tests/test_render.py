@@ -11,7 +11,7 @@ from soccer_diagrams.renderer import render
 from soccer_diagrams.schema import DrillDefinition
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_drill():
     fixture_path = Path(__file__).parent / "fixtures" / "sample_drill.json"
     with open(fixture_path) as f: